@@ -817,7 +817,7 @@ async def _async_resolve_domains_to_setup(
             # the setup process
             additional_manifests_to_load.update(
                 dep
-                for dep in chain(itg.dependencies, itg.after_dependencies)
+                for dep in itg.dependencies_and_after_dependencies
                 if dep not in integration_cache
             )
 
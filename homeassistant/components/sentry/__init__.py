@@ -141,8 +141,8 @@ def process_before_send(
     # triggers security rules, hiding all data.
     integrations = [
         integration
-        for integration in hass.config.components
-        if integration != "auth" and "." not in integration
+        for integration in hass.config.top_level_components
+        if integration != "auth"
     ]
 
     # Add additional tags based on what caused the event.
@@ -7,7 +7,7 @@ documentation as possible to keep it understandable.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from contextlib import suppress
 from dataclasses import dataclass
 import functools as ft
@@ -263,14 +263,17 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
-        ]
+    def get_sub_directories(paths: list[str]) -> list[str]:
+        """Return the names of all sub directories in a set of paths."""
+        # scandir gets the entry type from the directory listing,
+        # so unlike pathlib it does not need a stat call per entry
+        sub_directories: list[str] = []
+        for path in paths:
+            with os.scandir(path) as entries:
+                sub_directories.extend(
+                    entry.name for entry in entries if entry.is_dir()
+                )
+        return sub_directories
 
     dirs = await hass.async_add_executor_job(
         get_sub_directories, custom_components.__path__
@@ -280,7 +283,7 @@ async def _async_get_custom_components(
         _resolve_integrations_from_root,
         hass,
         custom_components,
-        [comp.name for comp in dirs],
+        dirs,
     )
     return {
         integration.domain: integration
@@ -318,20 +321,21 @@ async def async_get_config_flows(
 ) -> set[str]:
     """Return cached list of config flows."""
     integrations = await async_get_custom_components(hass)
-    flows: set[str] = set()
 
     if type_filter is not None:
-        flows.update(FLOWS[type_filter])
+        flows = set(FLOWS[type_filter])
+        flows.update(
+            integration.domain
+            for integration in integrations.values()
+            if integration.config_flow and integration.integration_type == type_filter
+        )
     else:
-        for type_flows in FLOWS.values():
-            flows.update(type_flows)
-
-    flows.update(
-        integration.domain
-        for integration in integrations.values()
-        if integration.config_flow
-        and (type_filter is None or integration.integration_type == type_filter)
-    )
+        flows = set().union(*FLOWS.values())
+        flows.update(
+            integration.domain
+            for integration in integrations.values()
+            if integration.config_flow
+        )
 
     return flows
 
@@ -637,7 +641,7 @@ class Integration:
                 continue
 
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                manifest = cast(Manifest, json_loads(manifest_path.read_bytes()))
             except JSON_DECODE_EXCEPTIONS as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
@@ -676,18 +680,7 @@ class Integration:
                     integration.domain,
                 )
                 return None
-            try:
-                AwesomeVersion(
-                    integration.version,
-                    ensure_strategy=[
-                        AwesomeVersionStrategy.CALVER,
-                        AwesomeVersionStrategy.SEMVER,
-                        AwesomeVersionStrategy.SIMPLEVER,
-                        AwesomeVersionStrategy.BUILDVER,
-                        AwesomeVersionStrategy.PEP440,
-                    ],
-                )
-            except AwesomeVersionException:
+            if not _is_valid_custom_integration_version(str(integration.version)):
                 _LOGGER.error(
                     (
                         "The custom integration '%s' does not have a valid version key"
@@ -765,17 +758,24 @@ class Integration:
     @cached_property
     def domain(self) -> str:
         """Return domain."""
-        return self.manifest["domain"]
+        # Manifests are parsed from JSON, intern the domain so lookups against
+        # the interned literals in generated and core code compare by identity
+        return sys.intern(self.manifest["domain"])
 
     @cached_property
     def dependencies(self) -> list[str]:
         """Return dependencies."""
-        return self.manifest.get("dependencies", [])
+        return [sys.intern(dep) for dep in self.manifest.get("dependencies", [])]
 
     @cached_property
     def after_dependencies(self) -> list[str]:
         """Return after_dependencies."""
-        return self.manifest.get("after_dependencies", [])
+        return [sys.intern(dep) for dep in self.manifest.get("after_dependencies", [])]
+
+    @cached_property
+    def dependencies_and_after_dependencies(self) -> tuple[str, ...]:
+        """Return dependencies followed by after_dependencies."""
+        return (*self.dependencies, *self.after_dependencies)
 
     @cached_property
     def requirements(self) -> list[str]:
@@ -838,47 +838,47 @@ class Integration:
         """Return if the integration has services."""
         return "services.yaml" in self._top_level_files
 
-    @property
+    @cached_property
     def mqtt(self) -> list[str] | None:
         """Return Integration MQTT entries."""
         return self.manifest.get("mqtt")
 
-    @property
+    @cached_property
     def ssdp(self) -> list[dict[str, str]] | None:
         """Return Integration SSDP entries."""
         return self.manifest.get("ssdp")
 
-    @property
+    @cached_property
     def zeroconf(self) -> list[str | dict[str, str]] | None:
         """Return Integration zeroconf entries."""
         return self.manifest.get("zeroconf")
 
-    @property
+    @cached_property
     def bluetooth(self) -> list[dict[str, str | int]] | None:
         """Return Integration bluetooth entries."""
         return self.manifest.get("bluetooth")
 
-    @property
+    @cached_property
     def dhcp(self) -> list[dict[str, str | bool]] | None:
         """Return Integration dhcp entries."""
         return self.manifest.get("dhcp")
 
-    @property
+    @cached_property
     def usb(self) -> list[dict[str, str]] | None:
         """Return Integration usb entries."""
         return self.manifest.get("usb")
 
-    @property
+    @cached_property
     def homekit(self) -> dict[str, list[str]] | None:
         """Return Integration homekit entries."""
         return self.manifest.get("homekit")
 
-    @property
+    @cached_property
     def is_built_in(self) -> bool:
         """Test if package is a built-in integration."""
         return self.pkg_path.startswith(PACKAGE_BUILTIN)
 
-    @property
+    @cached_property
     def version(self) -> AwesomeVersion | None:
         """Return the version of the integration."""
         if "version" not in self.manifest:
@@ -1114,7 +1114,7 @@ class Integration:
                     try:
                         platforms.update(
                             await self.hass.async_add_import_executor_job(
-                                self._load_platforms, platform_names
+                                self._load_platforms, load_executor_platforms
                             )
                         )
                     except ModuleNotFoundError:
@@ -1131,7 +1131,7 @@ class Integration:
                         load_event_loop_platforms.extend(load_executor_platforms)
 
                 if load_event_loop_platforms:
-                    platforms.update(self._load_platforms(platform_names))
+                    platforms.update(self._load_platforms(load_event_loop_platforms))
 
                 for platform_name, import_future in import_futures:
                     import_future.set_result(platforms[platform_name])
@@ -1269,6 +1269,29 @@ class Integration:
         return f"<Integration {self.domain}: {self.pkg_path}>"
 
 
+@ft.lru_cache(maxsize=512)
+def _is_valid_custom_integration_version(version: str) -> bool:
+    """Return True if the version uses a supported versioning strategy.
+
+    Custom integrations often share the same version string, so the
+    result is cached to avoid parsing it again for each one.
+    """
+    try:
+        AwesomeVersion(
+            version,
+            ensure_strategy=[
+                AwesomeVersionStrategy.CALVER,
+                AwesomeVersionStrategy.SEMVER,
+                AwesomeVersionStrategy.SIMPLEVER,
+                AwesomeVersionStrategy.BUILDVER,
+                AwesomeVersionStrategy.PEP440,
+            ],
+        )
+    except AwesomeVersionException:
+        return False
+    return True
+
+
 def _version_blocked(
     integration_version: AwesomeVersion,
     blocked_integration: BlockedIntegration,
@@ -1583,12 +1606,36 @@ async def _async_component_dependencies(
     hass: HomeAssistant,
     integration: Integration,
 ) -> set[str]:
-    """Get component dependencies."""
+    """Get component dependencies.
+
+    Walks the dependency graph depth first without recursion. Domains on the
+    current path are in loading, finished domains are in loaded, so every
+    integration is only visited once. Dependencies that have already resolved
+    their own dependencies are not walked again.
+    """
     loading: set[str] = set()
     loaded: set[str] = set()
+    stack: list[tuple[str, Iterator[tuple[str, Integration | Exception]]]] = []
+
+    # Resolve the dependency graph one level at a time first, so that every
+    # level is a single batched lookup instead of one lookup per integration.
+    # Errors are raised by the walk below, in dependency order.
+    seen: set[str] = {integration.domain}
+    to_resolve: set[str] = set(integration.dependencies)
+    while to_resolve:
+        seen.update(to_resolve)
+        resolved = await async_get_integrations(hass, to_resolve)
+        to_resolve = {
+            dependency
+            for dep_integration in resolved.values()
+            if not isinstance(dep_integration, Exception)
+            and dep_integration._all_dependencies_resolved is not True
+            for dependency in dep_integration.dependencies
+            if dependency not in seen
+        }
 
-    async def component_dependencies_impl(integration: Integration) -> None:
-        """Recursively get component dependencies."""
+    async def visit(integration: Integration) -> None:
+        """Start visiting an integration and its dependencies."""
         domain = integration.domain
         if not (dependencies := integration.dependencies):
             loaded.add(domain)
@@ -1596,7 +1643,13 @@ async def _async_component_dependencies(
 
         loading.add(domain)
         dep_integrations = await async_get_integrations(hass, dependencies)
-        for dependency_domain, dep_integration in dep_integrations.items():
+        stack.append((domain, iter(dep_integrations.items())))
+
+    await visit(integration)
+
+    while stack:
+        domain, dep_integrations = stack[-1]
+        for dependency_domain, dep_integration in dep_integrations:
             if isinstance(dep_integration, Exception):
                 raise dep_integration
 
@@ -1614,11 +1667,33 @@ async def _async_component_dependencies(
             if dependency_domain in loading:
                 raise CircularDependency(dependency_domain, domain)
 
-            await component_dependencies_impl(dep_integration)
-        loading.remove(domain)
-        loaded.add(domain)
+            # The dependency tree of an integration that resolved its
+            # dependencies has no cycle of its own, we only have to make sure
+            # it does not lead back to the current path.
+            if dep_integration._all_dependencies_resolved is True:
+                sub_dependencies = dep_integration.all_dependencies
+                if conflict := loading.intersection(sub_dependencies):
+                    raise CircularDependency(conflict, dependency_domain)
+                sub_integrations = await async_get_integrations(hass, sub_dependencies)
+                for sub_domain, sub_integration in sub_integrations.items():
+                    if isinstance(sub_integration, Exception):
+                        raise sub_integration
+                    if conflict := loading.intersection(
+                        sub_integration.after_dependencies
+                    ):
+                        raise CircularDependency(conflict, sub_domain)
+                loaded.update(sub_dependencies)
+                loaded.add(dependency_domain)
+                continue
 
-    await component_dependencies_impl(integration)
+            # Descend into the dependency, we continue with the remaining
+            # dependencies of this domain once it is loaded.
+            await visit(dep_integration)
+            break
+        else:
+            stack.pop()
+            loading.remove(domain)
+            loaded.add(domain)
 
     return loaded
 
@@ -198,7 +198,7 @@ class RequirementsManager:
 
         deps_to_check = {
             dep
-            for dep in integration.dependencies + integration.after_dependencies
+            for dep in integration.dependencies_and_after_dependencies
             if dep not in done
             # If the dep is in the cache and it's an Integration
             # it's already been checked for the requirements and we should
@@ -1,6 +1,7 @@
 """Helper for HomematicIP Cloud Tests."""
 
-import json
+import copy
+from functools import cache
 from unittest.mock import Mock, patch
 
 from homematicip.aio.class_maps import (
@@ -23,29 +24,35 @@ from homeassistant.components.homematicip_cloud.hap import HomematicipHAP
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 
-from tests.common import load_fixture
+from tests.common import load_json_object_fixture
 
 HAPID = "3014F7110000000000000001"
 HAPPIN = "5678"
 AUTH_TOKEN = "1234"
-FIXTURE_DATA = load_fixture("homematicip_cloud.json", "homematicip_cloud")
+
+
+@cache
+def _fixture_json() -> dict:
+    """Load and parse the fixture once, on first use."""
+    return load_json_object_fixture("homematicip_cloud.json", "homematicip_cloud")
 
 
 def get_and_check_entity_basics(hass, mock_hap, entity_id, entity_name, device_model):
     """Get and test basic device."""
     ha_state = hass.states.get(entity_id)
     assert ha_state is not None
+    attributes = ha_state.attributes
     if device_model:
-        assert ha_state.attributes[ATTR_MODEL_TYPE] == device_model
+        assert attributes[ATTR_MODEL_TYPE] == device_model
     assert ha_state.name == entity_name
 
     hmip_device = mock_hap.hmip_device_by_entity_id.get(entity_id)
 
     if hmip_device:
         if isinstance(hmip_device, AsyncDevice):
-            assert ha_state.attributes[ATTR_IS_GROUP] is False
+            assert attributes[ATTR_IS_GROUP] is False
         elif isinstance(hmip_device, AsyncGroup):
-            assert ha_state.attributes[ATTR_IS_GROUP]
+            assert attributes[ATTR_IS_GROUP]
     return ha_state, hmip_device
 
 
@@ -53,11 +60,31 @@ async def async_manipulate_test_data(
     hass, hmip_device, attribute, new_value, channel=1, fire_device=None
 ):
     """Set new value on hmip device."""
+    _manipulate_test_data(hmip_device, attribute, new_value, channel, fire_device)
+    await hass.async_block_till_done()
+
+
+async def async_manipulate_test_data_bulk(hass, edits):
+    """Set several new values on hmip devices and wait once for the updates.
+
+    Each edit is a tuple of the arguments of async_manipulate_test_data
+    following hass: (hmip_device, attribute, new_value[, channel[, fire_device]]).
+    """
+    for edit in edits:
+        _manipulate_test_data(*edit)
+    await hass.async_block_till_done()
+
+
+def _manipulate_test_data(
+    hmip_device, attribute, new_value, channel=1, fire_device=None
+):
+    """Set new value on hmip device and fire the update event."""
     if channel == 1:
         setattr(hmip_device, attribute, new_value)
-    if hasattr(hmip_device, "functionalChannels"):
-        functional_channel = hmip_device.functionalChannels[channel]
-        setattr(functional_channel, attribute, new_value)
+    if (
+        functional_channels := getattr(hmip_device, "functionalChannels", None)
+    ) is not None:
+        setattr(functional_channels[channel], attribute, new_value)
 
     fire_target = hmip_device if fire_device is None else fire_device
 
@@ -66,8 +93,6 @@ async def async_manipulate_test_data(
     else:
         fire_target.fire_update_event()
 
-    await hass.async_block_till_done()
-
 
 class HomeFactory:
     """Factory to create a HomematicIP Cloud Home."""
@@ -84,9 +109,13 @@ class HomeFactory:
         self.hmip_config_entry = hmip_config_entry
 
     async def async_get_mock_hap(
-        self, test_devices=[], test_groups=[]
+        self, test_devices=(), test_groups=(), generate_mocks=True
     ) -> HomematicipHAP:
-        """Create a mocked homematic access point."""
+        """Create a mocked homematic access point.
+
+        Tests that do not inspect calls on devices or groups can pass
+        generate_mocks=False to work on the plain hmip objects instead.
+        """
         home_name = self.hmip_config_entry.data["name"]
         mock_home = (
             HomeTemplate(
@@ -94,6 +123,7 @@ class HomeFactory:
                 home_name=home_name,
                 test_devices=test_devices,
                 test_groups=test_groups,
+                generate_mocks=generate_mocks,
             )
             .init_home()
             .get_async_home_mock()
@@ -126,11 +156,29 @@ class HomeTemplate(Home):
     The class also generated mocks of devices and groups for further testing.
     """
 
+    # Keep the template-only state out of __dict__, which gets copied onto
+    # the AsyncHome mock.
+    __slots__ = (
+        "init_json_state",
+        "test_devices",
+        "test_groups",
+        "generate_mocks",
+        "_test_devices_set",
+        "_test_groups_set",
+    )
+
     _typeClassMap = TYPE_CLASS_MAP
     _typeGroupMap = TYPE_GROUP_MAP
     _typeSecurityEventMap = TYPE_SECURITY_EVENT_MAP
 
-    def __init__(self, connection=None, home_name="", test_devices=[], test_groups=[]):
+    def __init__(
+        self,
+        connection=None,
+        home_name="",
+        test_devices=(),
+        test_groups=(),
+        generate_mocks=True,
+    ):
         """Init template with connection."""
         super().__init__(connection=connection)
         self.name = home_name
@@ -139,38 +187,48 @@ class HomeTemplate(Home):
         self.init_json_state = None
         self.test_devices = test_devices
         self.test_groups = test_groups
+        self.generate_mocks = generate_mocks
+        self._test_devices_set = (
+            frozenset(test_devices) if test_devices is not None else None
+        )
+        self._test_groups_set = (
+            frozenset(test_groups) if test_groups is not None else None
+        )
 
     def _cleanup_json(self, json):
-        if self.test_devices is not None:
-            new_devices = {}
-            for json_device in json["devices"].items():
-                if json_device[1]["label"] in self.test_devices:
-                    new_devices.update([json_device])
-            json["devices"] = new_devices
-
-        if self.test_groups is not None:
-            new_groups = {}
-            for json_group in json["groups"].items():
-                if json_group[1]["label"] in self.test_groups:
-                    new_groups.update([json_group])
-            json["groups"] = new_groups
-
-        return json
+        """Return a copy of the fixture with the requested devices and groups.
+
+        The sections are filtered before copying, so only the devices and
+        groups that are kept get deep-copied.
+        """
+        json = dict(json)
+        if self._test_devices_set is not None:
+            json["devices"] = _filter_by_label(json["devices"], self._test_devices_set)
+
+        if self._test_groups_set is not None:
+            json["groups"] = _filter_by_label(json["groups"], self._test_groups_set)
+
+        return copy.deepcopy(json)
 
     def init_home(self):
         """Init template with json."""
-        self.init_json_state = self._cleanup_json(json.loads(FIXTURE_DATA))
+        self.init_json_state = self._cleanup_json(_fixture_json())
         self.update_home(json_state=self.init_json_state, clearConfig=True)
         return self
 
     def update_home(self, json_state, clearConfig: bool = False):
         """Update home and ensure that mocks are created."""
         result = super().update_home(json_state, clearConfig)
-        self._generate_mocks()
+        if self.generate_mocks:
+            self._generate_mocks()
         return result
 
     def _generate_mocks(self):
-        """Generate mocks for groups and devices."""
+        """Generate mocks for groups and devices.
+
+        Devices and groups that are already mocked are reused and only get
+        their attributes refreshed from the wrapped instance.
+        """
         self.devices = [_get_mock(device) for device in self.devices]
 
         self.groups = [_get_mock(group) for group in self.groups]
@@ -185,6 +243,9 @@ class HomeTemplate(Home):
         It adds collections of mocked devices and groups to the home objects,
         and sets required attributes.
         """
+        # Spec against AsyncHome itself rather than a cached attribute list:
+        # the template wraps the synchronous Home, and the spec is what makes
+        # the coroutine methods of AsyncHome return awaitables.
         mock_home = Mock(
             spec=AsyncHome, wraps=self, label="Home", modelType="HomematicIP Home"
         )
@@ -193,12 +254,33 @@ class HomeTemplate(Home):
         return mock_home
 
 
+def _filter_by_label(items, labels):
+    """Return the items of a fixture section with one of the given labels."""
+    if not labels:
+        return {}
+    return {item_id: item for item_id, item in items.items() if item["label"] in labels}
+
+
 def _get_mock(instance):
     """Create a mock and copy instance attributes over mock."""
     if isinstance(instance, Mock):
         instance.__dict__.update(instance._mock_wraps.__dict__)
         return instance
 
-    mock = Mock(spec=instance, wraps=instance)
+    # Spec against the cached attributes of the class and set the class
+    # explicitly, so isinstance checks keep working without inspecting the
+    # same class again for every mock.
+    instance_class = type(instance)
+    mock = Mock(spec=_get_spec(instance_class), wraps=instance)
+    mock.__class__ = instance_class
+    # Copy the attributes rather than delegating lookups to the instance:
+    # Mock answers unknown attributes with child mocks, and tests set new
+    # values directly on the mock.
     mock.__dict__.update(instance.__dict__)
     return mock
+
+
+@cache
+def _get_spec(cls: type) -> list[str]:
+    """Return the attributes used as mock spec for a class."""
+    return dir(cls)
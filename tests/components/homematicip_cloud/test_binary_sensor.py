@@ -27,7 +27,11 @@ from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 
-from .helper import async_manipulate_test_data, get_and_check_entity_basics
+from .helper import (
+    async_manipulate_test_data,
+    async_manipulate_test_data_bulk,
+    get_and_check_entity_basics,
+)
 
 
 async def test_manually_configured_platform(hass: HomeAssistant) -> None:
@@ -481,11 +485,16 @@ async def test_hmip_security_zone_sensor_group(
     assert not ha_state.attributes.get(ATTR_SABOTAGE)
     assert not ha_state.attributes.get(ATTR_WINDOW_STATE)
 
-    await async_manipulate_test_data(hass, hmip_device, "motionDetected", True)
-    await async_manipulate_test_data(hass, hmip_device, "presenceDetected", True)
-    await async_manipulate_test_data(hass, hmip_device, "unreach", True)
-    await async_manipulate_test_data(hass, hmip_device, "sabotage", True)
-    await async_manipulate_test_data(hass, hmip_device, "windowState", WindowState.OPEN)
+    await async_manipulate_test_data_bulk(
+        hass,
+        [
+            (hmip_device, "motionDetected", True),
+            (hmip_device, "presenceDetected", True),
+            (hmip_device, "unreach", True),
+            (hmip_device, "sabotage", True),
+            (hmip_device, "windowState", WindowState.OPEN),
+        ],
+    )
     ha_state = hass.states.get(entity_id)
 
     assert ha_state.state == STATE_ON
@@ -538,15 +547,20 @@ async def test_hmip_security_sensor_group(
     assert not ha_state.attributes.get(ATTR_SABOTAGE)
     assert not ha_state.attributes.get(ATTR_WINDOW_STATE)
 
-    await async_manipulate_test_data(hass, hmip_device, "lowBat", True)
-    await async_manipulate_test_data(hass, hmip_device, "motionDetected", True)
-    await async_manipulate_test_data(hass, hmip_device, "presenceDetected", True)
-    await async_manipulate_test_data(hass, hmip_device, "powerMainsFailure", True)
-    await async_manipulate_test_data(hass, hmip_device, "moistureDetected", True)
-    await async_manipulate_test_data(hass, hmip_device, "waterlevelDetected", True)
-    await async_manipulate_test_data(hass, hmip_device, "unreach", True)
-    await async_manipulate_test_data(hass, hmip_device, "sabotage", True)
-    await async_manipulate_test_data(hass, hmip_device, "windowState", WindowState.OPEN)
+    await async_manipulate_test_data_bulk(
+        hass,
+        [
+            (hmip_device, "lowBat", True),
+            (hmip_device, "motionDetected", True),
+            (hmip_device, "presenceDetected", True),
+            (hmip_device, "powerMainsFailure", True),
+            (hmip_device, "moistureDetected", True),
+            (hmip_device, "waterlevelDetected", True),
+            (hmip_device, "unreach", True),
+            (hmip_device, "sabotage", True),
+            (hmip_device, "windowState", WindowState.OPEN),
+        ],
+    )
     ha_state = hass.states.get(entity_id)
 
     assert ha_state.state == STATE_ON
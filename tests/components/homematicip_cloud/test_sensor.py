@@ -36,7 +36,11 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 
-from .helper import async_manipulate_test_data, get_and_check_entity_basics
+from .helper import (
+    async_manipulate_test_data,
+    async_manipulate_test_data_bulk,
+    get_and_check_entity_basics,
+)
 
 
 async def test_manually_configured_platform(hass: HomeAssistant) -> None:
@@ -55,7 +59,7 @@ async def test_hmip_accesspoint_status(
     entity_name = "HOME_CONTROL_ACCESS_POINT Duty Cycle"
     device_model = "HmIP-HAP"
     mock_hap = await default_mock_hap_factory.async_get_mock_hap(
-        test_devices=["HOME_CONTROL_ACCESS_POINT"]
+        test_devices=["HOME_CONTROL_ACCESS_POINT"], generate_mocks=False
     )
 
     ha_state, hmip_device = get_and_check_entity_basics(
@@ -74,7 +78,7 @@ async def test_hmip_heating_thermostat(
     entity_name = "Heizkörperthermostat Heating"
     device_model = "HMIP-eTRV"
     mock_hap = await default_mock_hap_factory.async_get_mock_hap(
-        test_devices=["Heizkörperthermostat"]
+        test_devices=["Heizkörperthermostat"], generate_mocks=False
     )
 
     ha_state, hmip_device = get_and_check_entity_basics(
@@ -110,7 +114,7 @@ async def test_hmip_humidity_sensor(
     entity_name = "BWTH 1 Humidity"
     device_model = "HmIP-BWTH"
     mock_hap = await default_mock_hap_factory.async_get_mock_hap(
-        test_devices=["BWTH 1"]
+        test_devices=["BWTH 1"], generate_mocks=False
     )
 
     ha_state, hmip_device = get_and_check_entity_basics(
@@ -135,7 +139,7 @@ async def test_hmip_temperature_sensor1(
     entity_name = "BWTH 1 Temperature"
     device_model = "HmIP-BWTH"
     mock_hap = await default_mock_hap_factory.async_get_mock_hap(
-        test_devices=["BWTH 1"]
+        test_devices=["BWTH 1"], generate_mocks=False
     )
 
     ha_state, hmip_device = get_and_check_entity_basics(
@@ -162,7 +166,7 @@ async def test_hmip_temperature_sensor2(
     entity_name = "Heizkörperthermostat Temperature"
     device_model = "HMIP-eTRV"
     mock_hap = await default_mock_hap_factory.async_get_mock_hap(
-        test_devices=["Heizkörperthermostat"]
+        test_devices=["Heizkörperthermostat"], generate_mocks=False
     )
 
     ha_state, hmip_device = get_and_check_entity_basics(
@@ -189,7 +193,7 @@ async def test_hmip_temperature_sensor3(
     entity_name = "Raumbediengerät Analog Temperature"
     device_model = "ALPHA-IP-RBGa"
     mock_hap = await default_mock_hap_factory.async_get_mock_hap(
-        test_devices=["Raumbediengerät Analog"]
+        test_devices=["Raumbediengerät Analog"], generate_mocks=False
     )
 
     ha_state, hmip_device = get_and_check_entity_basics(
@@ -216,7 +220,7 @@ async def test_hmip_thermostat_evo_heating(
     entity_name = "thermostat_evo Heating"
     device_model = "HmIP-eTRV-E"
     mock_hap = await default_mock_hap_factory.async_get_mock_hap(
-        test_devices=["thermostat_evo"]
+        test_devices=["thermostat_evo"], generate_mocks=False
     )
 
     ha_state, hmip_device = get_and_check_entity_basics(
@@ -238,7 +242,7 @@ async def test_hmip_thermostat_evo_temperature(
     entity_name = "thermostat_evo Temperature"
     device_model = "HmIP-eTRV-E"
     mock_hap = await default_mock_hap_factory.async_get_mock_hap(
-        test_devices=["thermostat_evo"]
+        test_devices=["thermostat_evo"], generate_mocks=False
     )
 
     ha_state, hmip_device = get_and_check_entity_basics(
@@ -262,7 +266,7 @@ async def test_hmip_power_sensor(hass: HomeAssistant, default_mock_hap_factory)
     entity_name = "Flur oben Power"
     device_model = "HmIP-BSM"
     mock_hap = await default_mock_hap_factory.async_get_mock_hap(
-        test_devices=["Flur oben"]
+        test_devices=["Flur oben"], generate_mocks=False
     )
 
     ha_state, hmip_device = get_and_check_entity_basics(
@@ -280,11 +284,16 @@ async def test_hmip_power_sensor(hass: HomeAssistant, default_mock_hap_factory)
     assert not ha_state.attributes.get(ATTR_DEVICE_UNTERVOLTAGE)
     assert not ha_state.attributes.get(ATTR_DUTY_CYCLE_REACHED)
     assert not ha_state.attributes.get(ATTR_CONFIG_PENDING)
-    await async_manipulate_test_data(hass, hmip_device, "deviceOverheated", True)
-    await async_manipulate_test_data(hass, hmip_device, "deviceOverloaded", True)
-    await async_manipulate_test_data(hass, hmip_device, "deviceUndervoltage", True)
-    await async_manipulate_test_data(hass, hmip_device, "dutyCycle", True)
-    await async_manipulate_test_data(hass, hmip_device, "configPending", True)
+    await async_manipulate_test_data_bulk(
+        hass,
+        [
+            (hmip_device, "deviceOverheated", True),
+            (hmip_device, "deviceOverloaded", True),
+            (hmip_device, "deviceUndervoltage", True),
+            (hmip_device, "dutyCycle", True),
+            (hmip_device, "configPending", True),
+        ],
+    )
     ha_state = hass.states.get(entity_id)
     assert ha_state.attributes[ATTR_DEVICE_OVERHEATED]
     assert ha_state.attributes[ATTR_DEVICE_OVERLOADED]
@@ -301,7 +310,7 @@ async def test_hmip_illuminance_sensor1(
     entity_name = "Wettersensor Illuminance"
     device_model = "HmIP-SWO-B"
     mock_hap = await default_mock_hap_factory.async_get_mock_hap(
-        test_devices=["Wettersensor"]
+        test_devices=["Wettersensor"], generate_mocks=False
     )
 
     ha_state, hmip_device = get_and_check_entity_basics(
@@ -323,7 +332,7 @@ async def test_hmip_illuminance_sensor2(
     entity_name = "Lichtsensor Nord Illuminance"
     device_model = "HmIP-SLO"
     mock_hap = await default_mock_hap_factory.async_get_mock_hap(
-        test_devices=["Lichtsensor Nord"]
+        test_devices=["Lichtsensor Nord"], generate_mocks=False
     )
 
     ha_state, hmip_device = get_and_check_entity_basics(
@@ -348,7 +357,7 @@ async def test_hmip_windspeed_sensor(
     entity_name = "Wettersensor - pro Windspeed"
     device_model = "HmIP-SWO-PR"
     mock_hap = await default_mock_hap_factory.async_get_mock_hap(
-        test_devices=["Wettersensor - pro"]
+        test_devices=["Wettersensor - pro"], generate_mocks=False
     )
 
     ha_state, hmip_device = get_and_check_entity_basics(
@@ -399,7 +408,7 @@ async def test_hmip_today_rain_sensor(
     entity_name = "Weather Sensor – plus Today Rain"
     device_model = "HmIP-SWO-PL"
     mock_hap = await default_mock_hap_factory.async_get_mock_hap(
-        test_devices=["Weather Sensor – plus"]
+        test_devices=["Weather Sensor – plus"], generate_mocks=False
     )
 
     ha_state, hmip_device = get_and_check_entity_basics(
@@ -421,7 +430,9 @@ async def test_hmip_temperature_external_sensor_channel_1(
     entity_name = "STE2 Channel 1 Temperature"
     device_model = "HmIP-STE2-PCB"
 
-    mock_hap = await default_mock_hap_factory.async_get_mock_hap(test_devices=["STE2"])
+    mock_hap = await default_mock_hap_factory.async_get_mock_hap(
+        test_devices=["STE2"], generate_mocks=False
+    )
     ha_state, hmip_device = get_and_check_entity_basics(
         hass, mock_hap, entity_id, entity_name, device_model
     )
@@ -446,7 +457,9 @@ async def test_hmip_temperature_external_sensor_channel_2(
     entity_name = "STE2 Channel 2 Temperature"
     device_model = "HmIP-STE2-PCB"
 
-    mock_hap = await default_mock_hap_factory.async_get_mock_hap(test_devices=["STE2"])
+    mock_hap = await default_mock_hap_factory.async_get_mock_hap(
+        test_devices=["STE2"], generate_mocks=False
+    )
     ha_state, hmip_device = get_and_check_entity_basics(
         hass, mock_hap, entity_id, entity_name, device_model
     )
@@ -471,7 +484,9 @@ async def test_hmip_temperature_external_sensor_delta(
     entity_name = "STE2 Delta Temperature"
     device_model = "HmIP-STE2-PCB"
 
-    mock_hap = await default_mock_hap_factory.async_get_mock_hap(test_devices=["STE2"])
+    mock_hap = await default_mock_hap_factory.async_get_mock_hap(
+        test_devices=["STE2"], generate_mocks=False
+    )
     ha_state, hmip_device = get_and_check_entity_basics(
         hass, mock_hap, entity_id, entity_name, device_model
     )
@@ -498,7 +513,7 @@ async def test_hmip_passage_detector_delta_counter(
     entity_name = "SPDR_1"
     device_model = "HmIP-SPDR"
     mock_hap = await default_mock_hap_factory.async_get_mock_hap(
-        test_devices=[entity_name]
+        test_devices=[entity_name], generate_mocks=False
     )
 
     ha_state, hmip_device = get_and_check_entity_basics(
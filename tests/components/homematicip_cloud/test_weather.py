@@ -31,7 +31,7 @@ async def test_hmip_weather_sensor(
     entity_name = "Weather Sensor – plus"
     device_model = "HmIP-SWO-PL"
     mock_hap = await default_mock_hap_factory.async_get_mock_hap(
-        test_devices=[entity_name]
+        test_devices=[entity_name], generate_mocks=False
     )
 
     ha_state, hmip_device = get_and_check_entity_basics(
@@ -57,7 +57,7 @@ async def test_hmip_weather_sensor_pro(
     entity_name = "Wettersensor - pro"
     device_model = "HmIP-SWO-PR"
     mock_hap = await default_mock_hap_factory.async_get_mock_hap(
-        test_devices=[entity_name]
+        test_devices=[entity_name], generate_mocks=False
     )
 
     ha_state, hmip_device = get_and_check_entity_basics(
@@ -81,7 +81,7 @@ async def test_hmip_home_weather(hass: HomeAssistant, default_mock_hap_factory)
     entity_id = "weather.weather_1010_wien_osterreich"
     entity_name = "Weather 1010  Wien, Österreich"
     device_model = None
-    mock_hap = await default_mock_hap_factory.async_get_mock_hap()
+    mock_hap = await default_mock_hap_factory.async_get_mock_hap(generate_mocks=False)
 
     ha_state, hmip_device = get_and_check_entity_basics(
         hass, mock_hap, entity_id, entity_name, device_model
@@ -1,10 +1,12 @@
 """Test to verify that we can load components."""
 
 import asyncio
+from collections.abc import Generator
+from contextlib import contextmanager
 import os
 import sys
 import threading
-from typing import Any
+from typing import Any, NoReturn
 from unittest.mock import MagicMock, Mock, patch
 
 from awesomeversion import AwesomeVersion
@@ -19,6 +21,25 @@ from homeassistant.helpers import frame
 from .common import MockModule, async_get_persistent_notifications, mock_integration
 
 
+@contextmanager
+def _patch_import_module(side_effect: Exception) -> Generator[None, None, None]:
+    """Make importlib.import_module raise within the context.
+
+    Swaps the attribute directly for a plain function, which is cheaper
+    than setting up patch() and calling a Mock.
+    """
+
+    def _import_module(*args: Any, **kwargs: Any) -> NoReturn:
+        raise side_effect
+
+    original = loader.importlib.import_module
+    loader.importlib.import_module = _import_module
+    try:
+        yield
+    finally:
+        loader.importlib.import_module = original
+
+
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
     """Test if we can detect circular dependencies of components."""
     mock_integration(hass, MockModule("mod1"))
@@ -54,6 +75,31 @@ async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
         await loader._async_component_dependencies(hass, mod_4)
 
 
+async def test_circular_dependencies_through_resolved_integration(
+    hass: HomeAssistant,
+) -> None:
+    """Test circular dependencies are found through resolved dependencies."""
+    mock_integration(hass, MockModule("mod1"))
+    mod_2 = mock_integration(hass, MockModule("mod2", ["mod1"]))
+    mod_3 = mock_integration(hass, MockModule("mod3", ["mod2"]))
+
+    assert await mod_2.resolve_dependencies()
+    assert await loader._async_component_dependencies(hass, mod_3) == {
+        "mod1",
+        "mod2",
+        "mod3",
+    }
+
+    # Create a circular after_dependency below the resolved mod2
+    mod_1 = mock_integration(
+        hass, MockModule("mod1", partial_manifest={"after_dependencies": ["mod3"]})
+    )
+    assert await mod_1.resolve_dependencies()
+    assert await mod_2.resolve_dependencies()
+    with pytest.raises(loader.CircularDependency):
+        await loader._async_component_dependencies(hass, mod_3)
+
+
 async def test_nonexistent_component_dependencies(hass: HomeAssistant) -> None:
     """Test if we can detect nonexistent dependencies of components."""
     mod_1 = mock_integration(hass, MockModule("mod1", ["nonexistent"]))
@@ -169,6 +215,34 @@ async def test_custom_integration_version_not_valid(
     ) in caplog.text
 
 
+@pytest.mark.parametrize("version", [["1"], {"major": 1}])
+async def test_custom_integration_version_not_string(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    enable_custom_integrations: None,
+    version: Any,
+) -> None:
+    """Test that we log a warning when custom integrations have a non string version."""
+    original_json_loads = loader.json_loads
+
+    def _json_loads(data: bytes) -> Any:
+        manifest = original_json_loads(data)
+        if manifest["domain"] == "test_bad_version":
+            manifest["version"] = version
+        return manifest
+
+    with (
+        patch("homeassistant.loader.json_loads", _json_loads),
+        pytest.raises(loader.IntegrationNotFound),
+    ):
+        await loader.async_get_integration(hass, "test_bad_version")
+
+    assert (
+        "The custom integration 'test_bad_version' does not have a valid version key"
+        f" ({version}) in the manifest file and was blocked from loading."
+    ) in caplog.text
+
+
 @pytest.mark.parametrize(
     "blocked_versions",
     [
@@ -226,12 +300,12 @@ async def test_get_integration(hass: HomeAssistant) -> None:
         loader.async_get_loaded_integration(hass, "hue")
 
     integration = await loader.async_get_integration(hass, "hue")
-    assert hue == integration.get_component()
-    assert hue_light == integration.get_platform("light")
+    assert integration.get_component() is hue
+    assert integration.get_platform("light") is hue_light
 
     integration = loader.async_get_loaded_integration(hass, "hue")
-    assert hue == integration.get_component()
-    assert hue_light == integration.get_platform("light")
+    assert integration.get_component() is hue
+    assert integration.get_platform("light") is hue_light
 
 
 async def test_async_get_component(hass: HomeAssistant) -> None:
@@ -240,35 +314,23 @@ async def test_async_get_component(hass: HomeAssistant) -> None:
         loader.async_get_loaded_integration(hass, "hue")
 
     integration = await loader.async_get_integration(hass, "hue")
-    assert await integration.async_get_component() == hue
-    assert integration.get_platform("light") == hue_light
+    assert await integration.async_get_component() is hue
+    assert integration.get_platform("light") is hue_light
 
     integration = loader.async_get_loaded_integration(hass, "hue")
-    assert await integration.async_get_component() == hue
-    assert integration.get_platform("light") == hue_light
+    assert await integration.async_get_component() is hue
+    assert integration.get_platform("light") is hue_light
 
 
 async def test_get_integration_exceptions(hass: HomeAssistant) -> None:
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "hue")
 
-    with (
-        pytest.raises(ImportError),
-        patch(
-            "homeassistant.loader.importlib.import_module",
-            side_effect=ValueError("Boom"),
-        ),
-    ):
-        assert hue == integration.get_component()
+    with pytest.raises(ImportError), _patch_import_module(ValueError("Boom")):
+        assert integration.get_component() is hue
 
-    with (
-        pytest.raises(ImportError),
-        patch(
-            "homeassistant.loader.importlib.import_module",
-            side_effect=ValueError("Boom"),
-        ),
-    ):
-        assert hue_light == integration.get_platform("light")
+    with pytest.raises(ImportError), _patch_import_module(ValueError("Boom")):
+        assert integration.get_platform("light") is hue_light
 
 
 async def test_get_platform_caches_failures_when_component_loaded(
@@ -282,47 +344,35 @@ async def test_get_platform_caches_failures_when_component_loaded(
 
     with (
         pytest.raises(ModuleNotFoundError),
-        patch(
-            "homeassistant.loader.importlib.import_module",
-            side_effect=ModuleNotFoundError("Boom"),
-        ),
+        _patch_import_module(ModuleNotFoundError("Boom")),
     ):
-        assert integration.get_component() == hue
+        assert integration.get_component() is hue
 
     with (
         pytest.raises(ModuleNotFoundError),
-        patch(
-            "homeassistant.loader.importlib.import_module",
-            side_effect=ModuleNotFoundError("Boom"),
-        ),
+        _patch_import_module(ModuleNotFoundError("Boom")),
     ):
-        assert integration.get_platform("light") == hue_light
+        assert integration.get_platform("light") is hue_light
 
     # Hue is not loaded so we should still hit the import_module path
     with (
         pytest.raises(ModuleNotFoundError),
-        patch(
-            "homeassistant.loader.importlib.import_module",
-            side_effect=ModuleNotFoundError("Boom"),
-        ),
+        _patch_import_module(ModuleNotFoundError("Boom")),
     ):
-        assert integration.get_platform("light") == hue_light
+        assert integration.get_platform("light") is hue_light
 
-    assert integration.get_component() == hue
+    assert integration.get_component() is hue
 
     # Hue is loaded so we should cache the import_module failure now
     with (
         pytest.raises(ModuleNotFoundError),
-        patch(
-            "homeassistant.loader.importlib.import_module",
-            side_effect=ModuleNotFoundError("Boom"),
-        ),
+        _patch_import_module(ModuleNotFoundError("Boom")),
     ):
-        assert integration.get_platform("light") == hue_light
+        assert integration.get_platform("light") is hue_light
 
     # Hue is loaded and the last call should have cached the import_module failure
     with pytest.raises(ModuleNotFoundError):
-        assert integration.get_platform("light") == hue_light
+        assert integration.get_platform("light") is hue_light
 
 
 async def test_get_platform_only_cached_module_not_found_when_component_loaded(
@@ -331,48 +381,24 @@ async def test_get_platform_only_cached_module_not_found_when_component_loaded(
     """Test get_platform cache only cache module not found when the component is loaded."""
     integration = await loader.async_get_integration(hass, "hue")
 
-    with (
-        pytest.raises(ImportError),
-        patch(
-            "homeassistant.loader.importlib.import_module",
-            side_effect=ImportError("Boom"),
-        ),
-    ):
-        assert integration.get_component() == hue
+    with pytest.raises(ImportError), _patch_import_module(ImportError("Boom")):
+        assert integration.get_component() is hue
 
-    with (
-        pytest.raises(ImportError),
-        patch(
-            "homeassistant.loader.importlib.import_module",
-            side_effect=ImportError("Boom"),
-        ),
-    ):
-        assert integration.get_platform("light") == hue_light
+    with pytest.raises(ImportError), _patch_import_module(ImportError("Boom")):
+        assert integration.get_platform("light") is hue_light
 
     # Hue is not loaded so we should still hit the import_module path
-    with (
-        pytest.raises(ImportError),
-        patch(
-            "homeassistant.loader.importlib.import_module",
-            side_effect=ImportError("Boom"),
-        ),
-    ):
-        assert integration.get_platform("light") == hue_light
+    with pytest.raises(ImportError), _patch_import_module(ImportError("Boom")):
+        assert integration.get_platform("light") is hue_light
 
-    assert integration.get_component() == hue
+    assert integration.get_component() is hue
 
     # Hue is loaded so we should cache the import_module failure now
-    with (
-        pytest.raises(ImportError),
-        patch(
-            "homeassistant.loader.importlib.import_module",
-            side_effect=ImportError("Boom"),
-        ),
-    ):
-        assert integration.get_platform("light") == hue_light
+    with pytest.raises(ImportError), _patch_import_module(ImportError("Boom")):
+        assert integration.get_platform("light") is hue_light
 
     # ImportError is not cached because we only cache ModuleNotFoundError
-    assert integration.get_platform("light") == hue_light
+    assert integration.get_platform("light") is hue_light
 
 
 async def test_async_get_platform_caches_failures_when_component_loaded(
@@ -386,47 +412,35 @@ async def test_async_get_platform_caches_failures_when_component_loaded(
 
     with (
         pytest.raises(ModuleNotFoundError),
-        patch(
-            "homeassistant.loader.importlib.import_module",
-            side_effect=ModuleNotFoundError("Boom"),
-        ),
+        _patch_import_module(ModuleNotFoundError("Boom")),
     ):
-        assert integration.get_component() == hue
+        assert integration.get_component() is hue
 
     with (
         pytest.raises(ModuleNotFoundError),
-        patch(
-            "homeassistant.loader.importlib.import_module",
-            side_effect=ModuleNotFoundError("Boom"),
-        ),
+        _patch_import_module(ModuleNotFoundError("Boom")),
     ):
-        assert await integration.async_get_platform("light") == hue_light
+        assert await integration.async_get_platform("light") is hue_light
 
     # Hue is not loaded so we should still hit the import_module path
     with (
         pytest.raises(ModuleNotFoundError),
-        patch(
-            "homeassistant.loader.importlib.import_module",
-            side_effect=ModuleNotFoundError("Boom"),
-        ),
+        _patch_import_module(ModuleNotFoundError("Boom")),
     ):
-        assert await integration.async_get_platform("light") == hue_light
+        assert await integration.async_get_platform("light") is hue_light
 
-    assert integration.get_component() == hue
+    assert integration.get_component() is hue
 
     # Hue is loaded so we should cache the import_module failure now
     with (
         pytest.raises(ModuleNotFoundError),
-        patch(
-            "homeassistant.loader.importlib.import_module",
-            side_effect=ModuleNotFoundError("Boom"),
-        ),
+        _patch_import_module(ModuleNotFoundError("Boom")),
     ):
-        assert await integration.async_get_platform("light") == hue_light
+        assert await integration.async_get_platform("light") is hue_light
 
     # Hue is loaded and the last call should have cached the import_module failure
     with pytest.raises(ModuleNotFoundError):
-        assert await integration.async_get_platform("light") == hue_light
+        assert await integration.async_get_platform("light") is hue_light
 
     # The cache should never be filled because the import error is remembered
     assert integration.get_platform_cached("light") is None
@@ -443,41 +457,29 @@ async def test_async_get_platforms_caches_failures_when_component_loaded(
 
     with (
         pytest.raises(ModuleNotFoundError),
-        patch(
-            "homeassistant.loader.importlib.import_module",
-            side_effect=ModuleNotFoundError("Boom"),
-        ),
+        _patch_import_module(ModuleNotFoundError("Boom")),
     ):
-        assert integration.get_component() == hue
+        assert integration.get_component() is hue
 
     with (
         pytest.raises(ModuleNotFoundError),
-        patch(
-            "homeassistant.loader.importlib.import_module",
-            side_effect=ModuleNotFoundError("Boom"),
-        ),
+        _patch_import_module(ModuleNotFoundError("Boom")),
     ):
         assert await integration.async_get_platforms(["light"]) == {"light": hue_light}
 
     # Hue is not loaded so we should still hit the import_module path
     with (
         pytest.raises(ModuleNotFoundError),
-        patch(
-            "homeassistant.loader.importlib.import_module",
-            side_effect=ModuleNotFoundError("Boom"),
-        ),
+        _patch_import_module(ModuleNotFoundError("Boom")),
     ):
         assert await integration.async_get_platforms(["light"]) == {"light": hue_light}
 
-    assert integration.get_component() == hue
+    assert integration.get_component() is hue
 
     # Hue is loaded so we should cache the import_module failure now
     with (
         pytest.raises(ModuleNotFoundError),
-        patch(
-            "homeassistant.loader.importlib.import_module",
-            side_effect=ModuleNotFoundError("Boom"),
-        ),
+        _patch_import_module(ModuleNotFoundError("Boom")),
     ):
         assert await integration.async_get_platforms(["light"]) == {"light": hue_light}
 
@@ -1770,8 +1772,10 @@ async def test_async_get_platforms_loads_loop_if_already_in_sys_modules(
     button_module_mock = MagicMock()
     switch_module_mock = MagicMock()
     light_module_mock = MagicMock()
+    imported: list[str] = []
 
     def import_module(name: str) -> Any:
+        imported.append(name)
         if name == button_module_name:
             return button_module_mock
         if name == switch_module_name:
@@ -1818,6 +1822,7 @@ async def test_async_get_platforms_loads_loop_if_already_in_sys_modules(
     assert module is button_module_mock
     caplog.clear()
 
+    imported.clear()
     modules_without_switch = {
         k: v for k, v in sys.modules.items() if k not in switch_module_name
     }
@@ -1842,6 +1847,9 @@ async def test_async_get_platforms_loads_loop_if_already_in_sys_modules(
         "switch": switch_module_mock,
         "light": light_module_mock,
     }
+    # Each platform that is not cached is imported once, either
+    # in the executor or in the loop
+    assert sorted(imported) == [light_module_name, switch_module_name]
     assert integration.get_platform_cached("button") is button_module_mock
     assert integration.get_platform_cached("switch") is switch_module_mock
     assert integration.get_platform_cached("light") is light_module_mock